@@ -8,39 +8,55 @@ Usage:
   python generate_nametags.py path/to/students.csv \
       --output nametags.pdf \
       --footer "INFO 5410, Urban Systems, Fall 2025" \
-      [--page-size letter|a4] [--no-border] [--rows N --cols M] [--tent] [--tent-style tri|bi]
+      [--page-size letter|a4] [--no-border] [--rows N --cols M] [--tent] [--tent-style tri|bi] \
+      [--no-compress] [--jobs N]
 
-Dependencies: reportlab
+Dependencies: reportlab (plus pypdf for --jobs > 1)
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import io
+import math
 import os
 import re
-from typing import Iterable, List, Optional, Sequence, Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple, Dict, Union
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter, landscape
 from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth as _pdf_string_width
 from reportlab.pdfgen import canvas
 
+_WS_RE = re.compile(r"\s+")
+_NORM_RE = re.compile(r"[^a-z0-9]")
+
 
 def normalize_header(header: str) -> str:
     """Normalize a CSV header to allow forgiving matches (e.g., "Full name" → "fullname")."""
-    return re.sub(r"[^a-z0-9]", "", header.strip().lower())
+    return _NORM_RE.sub("", header.strip().lower())
 
 
-def detect_fullname_field(fieldnames: Sequence[str]) -> Optional[str]:
+def detect_fullname_field(
+    fieldnames: Sequence[str],
+    normalized_to_original: Optional[Dict[str, str]] = None,
+) -> Optional[str]:
     """Return the original header name that represents the full name column.
 
     We match by normalized header against common variants like fullname, name, studentname.
+    Callers that already built the normalized -> original header mapping can pass it in.
     """
     if not fieldnames:
         return None
 
-    normalized_to_original = {normalize_header(h): h for h in fieldnames}
+    if normalized_to_original is None:
+        normalized_to_original = {normalize_header(h): h for h in fieldnames}
     candidate_keys = [
         "fullname",
         "name",
@@ -57,21 +73,47 @@ def detect_fullname_field(fieldnames: Sequence[str]) -> Optional[str]:
     return None
 
 
+def _column_index(headers: Sequence[str], field: Optional[str]) -> int:
+    """Return the position of field in headers (last match wins, as with DictReader), or -1."""
+    if field is None:
+        return -1
+    index = -1
+    for i, header in enumerate(headers):
+        if header == field:
+            index = i
+    return index
+
+
+def _cell(row: Sequence[str], index: int) -> str:
+    """Return row[index], or an empty string for a missing column or short row."""
+    if 0 <= index < len(row):
+        return row[index]
+    return ""
+
+
 def read_full_names_from_csv(
     csv_path: str,
     preferred_by_netid: Optional[Dict[str, str]] = None,
-) -> List[str]:
-    """Read the students CSV and return a list of display names.
+    inline_preferred: bool = False,
+) -> Iterator[str]:
+    """Read the students CSV and yield display names, one row at a time.
 
     If a preferred names mapping is provided, attempt to derive a netid from the
     Email field (by splitting at '@') and, when a non-empty preferred_name exists
     for that netid, use it as the nametag text. Otherwise, fall back to the full name.
+
+    With inline_preferred, a non-empty value in the CSV's own preferred name
+    column (e.g. 'preferred_name') is used instead, so a roster that carries its
+    preferred names needs only this one pass.
+
+    Rows are streamed rather than collected, so the column checks run (and may
+    raise) when iteration starts.
     """
-    names: List[str] = []
     with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
-        full_name_field = detect_fullname_field(fieldnames)
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        normalized_to_original = {normalize_header(h): h for h in fieldnames}
+        full_name_field = detect_fullname_field(fieldnames, normalized_to_original)
         if not full_name_field:
             raise ValueError(
                 "Could not find a 'Full Name' column in the CSV. "
@@ -80,24 +122,34 @@ def read_full_names_from_csv(
 
         # Detect an Email-like field by normalized header containing 'email'
         email_field: Optional[str] = None
-        normalized_to_original = {normalize_header(h): h for h in fieldnames}
         for norm, original in normalized_to_original.items():
             if "email" in norm:
                 email_field = original
                 break
 
+        preferred_field: Optional[str] = None
+        if inline_preferred:
+            preferred_field = normalized_to_original.get("preferredname")
+
+        name_idx = _column_index(fieldnames, full_name_field)
+        email_idx = _column_index(fieldnames, email_field)
+        preferred_idx = _column_index(fieldnames, preferred_field)
+
         for row in reader:
-            raw_full = row.get(full_name_field, "").strip()
+            raw_full = _cell(row, name_idx).strip()
             if not raw_full:
                 continue
-            clean_full = re.sub(r"\s+", " ", raw_full).strip().strip('"')
+            clean_full = _WS_RE.sub(" ", raw_full).strip().strip('"')
             if not clean_full:
                 continue
 
             # Default to full name; override with preferred when available
             display_name = clean_full
-            if preferred_by_netid and email_field:
-                email_value = (row.get(email_field) or "").strip()
+            preferred_inline = _cell(row, preferred_idx).strip()
+            if preferred_inline:
+                display_name = preferred_inline
+            elif preferred_by_netid and email_field:
+                email_value = _cell(row, email_idx).strip()
                 if email_value and "@" in email_value:
                     netid = email_value.split("@", 1)[0].strip()
                     preferred = preferred_by_netid.get(netid)
@@ -106,8 +158,7 @@ def read_full_names_from_csv(
                         if preferred_clean:
                             display_name = preferred_clean
 
-            names.append(display_name)
-    return names
+            yield display_name
 
 def load_preferred_names_csv(csv_path: str) -> Dict[str, str]:
     """Load a mapping of netid -> preferred_name from a CSV.
@@ -118,93 +169,286 @@ def load_preferred_names_csv(csv_path: str) -> Dict[str, str]:
     """
     mapping: Dict[str, str] = {}
     with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        netid_idx = _column_index(headers, "netid")
+        preferred_idx = _column_index(headers, "preferred_name")
         for row in reader:
-            netid = (row.get("netid") or "").strip()
+            netid = _cell(row, netid_idx).strip()
             if not netid:
                 continue
-            preferred_name = (row.get("preferred_name") or "").strip()
+            preferred_name = _cell(row, preferred_idx).strip()
             mapping[netid] = preferred_name
     return mapping
 
 
-def measure_text_width(pdf: canvas.Canvas, text: str, font_name: str, font_size: float) -> float:
-    return pdf.stringWidth(text, font_name, font_size)
+# Width of (font_name, text) at font size 1; any other size is a multiplication away
+_width_cache: Dict[Tuple[str, str], float] = {}
+
+# Per-font (codec, glyph widths in 1/1000 em) for single-byte fonts such as
+# Helvetica, or None for fonts that must go through stringWidth
+_glyph_width_tables: Dict[str, Optional[Tuple[str, Sequence[int]]]] = {}
+
+
+def _table_unit_width(text: str, font_name: str) -> Optional[float]:
+    """Sum glyph widths from the font's width table; None if stringWidth is needed.
+
+    This is what reportlab does for a single-byte font when every character is
+    in the font's encoding, minus the per-call font lookup and dispatch.
+    """
+    if font_name not in _glyph_width_tables:
+        font = pdfmetrics.getFont(font_name)
+        if type(font) is pdfmetrics.Font:
+            _glyph_width_tables[font_name] = (font.encName, font.widths)
+        else:
+            # TrueType and CID fonts measure text differently
+            _glyph_width_tables[font_name] = None
+    table = _glyph_width_tables[font_name]
+    if table is None:
+        return None
+    encoding, widths = table
+    try:
+        encoded = text.encode(encoding)
+    except UnicodeEncodeError:
+        # Characters outside the encoding fall back to substitution fonts
+        return None
+    return sum(map(widths.__getitem__, encoded)) * 0.001
+
+
+def unit_width(text: str, font_name: str) -> float:
+    """Return the width of text at font size 1, measuring each (font, text) pair once.
+
+    Widths depend only on font metrics, so no canvas is needed.
+    """
+    key = (font_name, text)
+    width = _width_cache.get(key)
+    if width is None:
+        width = _table_unit_width(text, font_name)
+        if width is None:
+            width = _pdf_string_width(text, font_name, 1.0)
+        _width_cache[key] = width
+    return width
+
+
+def measure_text_width(text: str, font_name: str, font_size: float) -> float:
+    return unit_width(text, font_name) * font_size
 
 
 def find_font_size_for_line(
-    pdf: canvas.Canvas,
     text: str,
     font_name: str,
     max_width: float,
     max_size: int = 72,
     min_size: int = 18,
 ) -> int:
-    """Find the largest font size that allows the line to fit within max_width."""
-    for size in range(max_size, min_size - 1, -1):
-        if measure_text_width(pdf, text, font_name, size) <= max_width:
-            return size
-    return min_size
+    """Find the largest font size that allows the line to fit within max_width.
+
+    Text width is linear in font size, so a single measurement at size 1 gives
+    the answer in closed form; the neighbouring sizes are then re-checked to
+    absorb floating-point rounding at the boundary.
+    """
+    width_at_1 = unit_width(text, font_name)
+    if width_at_1 <= 0:
+        return max(min_size, max_size)
+    size = max(min_size, min(max_size, int(max_width / width_at_1)))
+    while size > min_size and width_at_1 * size > max_width:
+        size -= 1
+    while size < max_size and width_at_1 * (size + 1) <= max_width:
+        size += 1
+    return size
 
 
 def try_two_line_split(
-    pdf: canvas.Canvas,
-    text: str,
+    words: Sequence[str],
     font_name: str,
     target_size: int,
     max_width: float,
-) -> Optional[Tuple[List[str], int]]:
-    """Try splitting text into two lines that both fit within max_width at target_size.
+) -> Optional[Tuple[Tuple[str, ...], int]]:
+    """Try splitting words into two lines that both fit within max_width at target_size.
 
-    Returns (lines, size) if successful, otherwise None.
+    The split with the smallest max line width is the best candidate at every
+    size, so it is chosen from prefix sums of per-word widths and then checked
+    against max_width. Takes the already-split words so callers searching over
+    sizes split the text once. Returns (lines, size) if successful, otherwise None.
     """
-    words = text.split()
     if len(words) <= 1:
         return None
-    best_split: Optional[Tuple[List[str], int]] = None
-    # Try splits at each possible break; choose the one with the smallest max line width
-    best_max_line_width = float("inf")
+    # A line's width is its word widths plus the spaces between them. Sum in
+    # integer 1/1000 em (glyph widths are whole units) so equally balanced
+    # splits tie exactly and the first one wins, as when measuring each split.
+    word_widths = [round(unit_width(word, font_name) * 1000) for word in words]
+    space_width = round(unit_width(" ", font_name) * 1000)
+    total_width = sum(word_widths) + space_width * (len(words) - 1)
+    best_index = 1
+    best_max_line_width = total_width + 1
+    left_width = -space_width
     for i in range(1, len(words)):
-        line1 = " ".join(words[:i])
-        line2 = " ".join(words[i:])
-        w1 = measure_text_width(pdf, line1, font_name, target_size)
-        w2 = measure_text_width(pdf, line2, font_name, target_size)
-        maxw = max(w1, w2)
-        if w1 <= max_width and w2 <= max_width and maxw < best_max_line_width:
+        left_width += word_widths[i - 1] + space_width
+        right_width = total_width - left_width - space_width
+        maxw = max(left_width, right_width)
+        if maxw < best_max_line_width:
             best_max_line_width = maxw
-            best_split = ([line1, line2], target_size)
-    return best_split
+            best_index = i
+    line1 = " ".join(words[:best_index])
+    line2 = " ".join(words[best_index:])
+    # Check the fit against the measured lines
+    w1 = unit_width(line1, font_name) * target_size
+    w2 = unit_width(line2, font_name) * target_size
+    if w1 <= max_width and w2 <= max_width:
+        return (line1, line2), target_size
+    return None
 
 
+@lru_cache(maxsize=None)
 def layout_name_lines(
-    pdf: canvas.Canvas,
     name_text: str,
     font_name: str,
     max_width: float,
     max_size: int = 72,
     min_size: int = 18,
-) -> Tuple[List[str], int]:
+) -> Tuple[Tuple[str, ...], int]:
     """Compute one- or two-line layout for the name that fits within max_width.
 
     Preference order:
       1) Single line at the largest possible size
       2) Two lines at the largest possible size where both lines fit
-    """
-    # First try single-line fit from large to small
-    single_line_size = find_font_size_for_line(
-        pdf, name_text, font_name, max_width, max_size=max_size, min_size=min_size
-    )
-    if measure_text_width(pdf, name_text, font_name, single_line_size) <= max_width:
-        return [name_text], single_line_size
 
-    # Try two-line splits starting from large to small
-    for candidate_size in range(max_size, min_size - 1, -1):
-        split = try_two_line_split(pdf, name_text, font_name, candidate_size, max_width)
+    Results are memoized, so duplicate names and the repeated panels of a tent
+    card are laid out only once per tag geometry.
+    """
+    # Common case: the name fits on one line at min_size, so it is laid out on
+    # one line at the closed-form largest size without any split search
+    if unit_width(name_text, font_name) * min_size <= max_width:
+        single_line_size = find_font_size_for_line(
+            name_text, font_name, max_width, max_size=max_size, min_size=min_size
+        )
+        return (name_text,), single_line_size
+
+    # Try two-line splits: if some split fits at a size it also fits at every
+    # smaller size, so binary search for the largest size that works. The words
+    # are split once and shared by every candidate size.
+    words = name_text.split()
+    best_split: Optional[Tuple[Tuple[str, ...], int]] = None
+    low, high = min_size, max_size
+    while len(words) > 1 and low <= high:
+        candidate_size = (low + high) // 2
+        split = try_two_line_split(words, font_name, candidate_size, max_width)
         if split is not None:
-            return split
+            best_split = split
+            low = candidate_size + 1
+        else:
+            high = candidate_size - 1
+    if best_split is not None:
+        return best_split
 
     # Fallback to single line at min size
-    return [name_text], min_size
+    return (name_text,), min_size
+
+
+class StateCachingCanvas(canvas.Canvas):
+    """Canvas that skips font, color, line width, and dash changes that are no-ops.
+
+    Every tag sets the same handful of graphics state values, and reportlab emits
+    PDF operators for each call even when nothing changes. The last value set is
+    tracked here (None meaning unknown) and saved/restored alongside the PDF
+    graphics state; a new page or form starts from an unknown state again.
+    """
+
+    _STATE_KEYS = ("_cur_font", "_cur_fill", "_cur_stroke", "_cur_lw", "_cur_dash")
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._cached_state_stack: List[Tuple[object, ...]] = []
+        self._reset_cached_state()
+        super().__init__(*args, **kwargs)
+
+    def _reset_cached_state(self) -> None:
+        for key in self._STATE_KEYS:
+            setattr(self, key, None)
+
+    def _push_cached_state(self) -> None:
+        self._cached_state_stack.append(tuple(getattr(self, key) for key in self._STATE_KEYS))
+
+    def _pop_cached_state(self) -> None:
+        for key, value in zip(self._STATE_KEYS, self._cached_state_stack.pop()):
+            setattr(self, key, value)
+
+    def setFont(self, psfontname, size, leading=None):
+        state = (psfontname, size, leading)
+        if state == self._cur_font:
+            return
+        super().setFont(psfontname, size, leading)
+        self._cur_font = state
+
+    def setFillColor(self, aColor, alpha=None):
+        state = (aColor, alpha)
+        if state == self._cur_fill:
+            return
+        super().setFillColor(aColor, alpha)
+        self._cur_fill = state
+
+    def setStrokeColor(self, aColor, alpha=None):
+        state = (aColor, alpha)
+        if state == self._cur_stroke:
+            return
+        super().setStrokeColor(aColor, alpha)
+        self._cur_stroke = state
+
+    def setLineWidth(self, width):
+        if width == self._cur_lw:
+            return
+        super().setLineWidth(width)
+        self._cur_lw = width
+
+    def setDash(self, array=[], phase=0):
+        state = (tuple(array) if isinstance(array, (list, tuple)) else array, phase)
+        if state == self._cur_dash:
+            return
+        super().setDash(array, phase)
+        self._cur_dash = state
+
+    def saveState(self):
+        self._push_cached_state()
+        super().saveState()
+
+    def restoreState(self):
+        super().restoreState()
+        self._pop_cached_state()
+
+    def showPage(self):
+        super().showPage()
+        self._reset_cached_state()
+
+    def beginForm(self, *args, **kwargs):
+        self._push_cached_state()
+        self._reset_cached_state()
+        super().beginForm(*args, **kwargs)
+
+    def endForm(self, **extra_attributes):
+        super().endForm(**extra_attributes)
+        self._pop_cached_state()
+
+
+def _draw_nametag_frame(
+    pdf: canvas.Canvas,
+    x: float,
+    y: float,
+    tag_width: float,
+    tag_height: float,
+    draw_border: bool = True,
+) -> None:
+    """Draws the static artwork of a flat nametag: the optional cut border."""
+    if draw_border:
+        pdf.setStrokeColor(colors.black)
+        pdf.setLineWidth(0.8)
+        pdf.rect(x, y, tag_width, tag_height, stroke=1, fill=0)
+
+
+def _draw_frame_form(pdf: canvas.Canvas, frame_name: str, x: float, y: float) -> None:
+    """Draws a tag's static artwork, defined once as a form, with its origin at (x, y)."""
+    pdf.saveState()
+    pdf.translate(x, y)
+    pdf.doForm(frame_name)
+    pdf.restoreState()
 
 
 def draw_nametag(
@@ -216,6 +460,7 @@ def draw_nametag(
     name_text: str,
     footer_text: str,
     draw_border: bool = True,
+    frame_name: Optional[str] = None,
 ) -> None:
     padding_x = 0.35 * inch
     # Footer closer to bottom to free space for larger names
@@ -223,22 +468,22 @@ def draw_nametag(
     available_width = max(0.0, tag_width - 2 * padding_x)
 
     # Optional border to guide cutting
-    if draw_border:
-        pdf.setStrokeColor(colors.black)
-        pdf.setLineWidth(0.8)
-        pdf.rect(x, y, tag_width, tag_height, stroke=1, fill=0)
+    if frame_name:
+        _draw_frame_form(pdf, frame_name, x, y)
+    else:
+        _draw_nametag_frame(pdf, x, y, tag_width, tag_height, draw_border)
 
     # Footer
     footer_font = "Helvetica"
     footer_size = 10
     pdf.setFont(footer_font, footer_size)
     footer_y = y + padding_y
-    footer_width = measure_text_width(pdf, footer_text, footer_font, footer_size)
+    footer_width = measure_text_width(footer_text, footer_font, footer_size)
     if footer_width > available_width:
         # Shrink footer if needed
-        footer_size = find_font_size_for_line(pdf, footer_text, footer_font, available_width, max_size=14, min_size=8)
+        footer_size = find_font_size_for_line(footer_text, footer_font, available_width, max_size=14, min_size=8)
         pdf.setFont(footer_font, footer_size)
-        footer_width = measure_text_width(pdf, footer_text, footer_font, footer_size)
+        footer_width = measure_text_width(footer_text, footer_font, footer_size)
     footer_x = x + (tag_width - footer_width) / 2.0
     pdf.setFillColor(colors.black)
     pdf.drawString(footer_x, footer_y, footer_text)
@@ -252,7 +497,7 @@ def draw_nametag(
 
     # Allow larger names; vertical autoscale prevents overlap
     lines, font_size = layout_name_lines(
-        pdf, name_text, name_font, available_width, max_size=96, min_size=18
+        name_text, name_font, available_width, max_size=96, min_size=18
     )
     pdf.setFont(name_font, font_size)
 
@@ -272,7 +517,7 @@ def draw_nametag(
         name_area_bottom + (name_area_height - total_text_height) / 2.0,
     )
     for i, line in enumerate(lines):
-        line_width = measure_text_width(pdf, line, name_font, font_size)
+        line_width = measure_text_width(line, name_font, font_size)
         text_x = x + (tag_width - line_width) / 2.0
         text_y = start_y + (len(lines) - 1 - i) * (font_size + line_gap_ratio * font_size)
         pdf.drawString(text_x, text_y, line)
@@ -295,11 +540,11 @@ def _draw_panel_content_at_origin(
     footer_size = 10
     pdf.setFont(footer_font, footer_size)
     footer_y = padding_y
-    footer_width = measure_text_width(pdf, footer_text, footer_font, footer_size)
+    footer_width = measure_text_width(footer_text, footer_font, footer_size)
     if footer_width > available_width:
-        footer_size = find_font_size_for_line(pdf, footer_text, footer_font, available_width, max_size=14, min_size=8)
+        footer_size = find_font_size_for_line(footer_text, footer_font, available_width, max_size=14, min_size=8)
         pdf.setFont(footer_font, footer_size)
-        footer_width = measure_text_width(pdf, footer_text, footer_font, footer_size)
+        footer_width = measure_text_width(footer_text, footer_font, footer_size)
     footer_x = (region_width - footer_width) / 2.0
     pdf.setFillColor(colors.black)
     pdf.drawString(footer_x, footer_y, footer_text)
@@ -311,7 +556,7 @@ def _draw_panel_content_at_origin(
     name_area_height = max(0.0, name_area_top - name_area_bottom)
 
     lines, font_size = layout_name_lines(
-        pdf, name_text, name_font, available_width, max_size=84, min_size=18
+        name_text, name_font, available_width, max_size=84, min_size=18
     )
     pdf.setFont(name_font, font_size)
     line_gap_ratio = 0.15
@@ -328,32 +573,22 @@ def _draw_panel_content_at_origin(
         name_area_bottom + (name_area_height - total_text_height) / 2.0,
     )
     for i, line in enumerate(lines):
-        line_width = measure_text_width(pdf, line, name_font, font_size)
+        line_width = measure_text_width(line, name_font, font_size)
         text_x = (region_width - line_width) / 2.0
         text_y = start_y + (len(lines) - 1 - i) * (font_size + line_gap_ratio * font_size)
         pdf.drawString(text_x, text_y, line)
 
 
-def draw_tent_card(
+def _draw_tent_card_frame(
     pdf: canvas.Canvas,
     x: float,
     y: float,
     tag_width: float,
     tag_height: float,
-    name_text: str,
-    footer_text: str,
     draw_border: bool = True,
 ) -> None:
-    """Draw a tent-style nametag with three equal-height panels (back, front, flap).
-
-    Layout per column (y increases upward):
-      - Top third: back face (rotated 180° so it's upright when folded)
-      - Middle third: front face (upright)
-      - Bottom third: flap (blank, with light label)
-    """
+    """Draws the static artwork of a tri-panel tent: border, fold lines, and flap label."""
     panel_h = tag_height / 3.0
-    pad_x = 0.35 * inch
-    pad_y = 0.18 * inch
 
     # Outer cut border
     if draw_border:
@@ -369,6 +604,45 @@ def draw_tent_card(
     pdf.line(x, y + 2 * panel_h, x + tag_width, y + 2 * panel_h)
     pdf.setDash()  # reset
 
+    # Bottom panel label (flap)
+    pdf.saveState()
+    pdf.translate(x, y)
+    pdf.setFont("Helvetica", 9)
+    pdf.setFillColor(colors.grey)
+    label = "Fold/Glue Flap"
+    lw = measure_text_width(label, "Helvetica", 9)
+    pdf.drawString((tag_width - lw) / 2.0, panel_h / 2.0 - 4, label)
+    pdf.restoreState()
+
+
+def draw_tent_card(
+    pdf: canvas.Canvas,
+    x: float,
+    y: float,
+    tag_width: float,
+    tag_height: float,
+    name_text: str,
+    footer_text: str,
+    draw_border: bool = True,
+    frame_name: Optional[str] = None,
+) -> None:
+    """Draw a tent-style nametag with three equal-height panels (back, front, flap).
+
+    Layout per column (y increases upward):
+      - Top third: back face (rotated 180° so it's upright when folded)
+      - Middle third: front face (upright)
+      - Bottom third: flap (blank, with light label)
+    """
+    panel_h = tag_height / 3.0
+    pad_x = 0.35 * inch
+    pad_y = 0.18 * inch
+
+    # Border, fold lines, and flap label
+    if frame_name:
+        _draw_frame_form(pdf, frame_name, x, y)
+    else:
+        _draw_tent_card_frame(pdf, x, y, tag_width, tag_height, draw_border)
+
     # Middle panel (front face) content at origin translated to middle panel bottom-left
     pdf.saveState()
     pdf.translate(x, y + panel_h)
@@ -385,14 +659,39 @@ def draw_tent_card(
     _draw_panel_content_at_origin(pdf, tag_width, panel_h, name_text, footer_text, pad_x, pad_y)
     pdf.restoreState()
 
-    # Bottom panel label (flap)
+
+def _draw_tent_card_bi_frame(
+    pdf: canvas.Canvas,
+    x: float,
+    y: float,
+    tag_width: float,
+    tag_height: float,
+    draw_border: bool = True,
+) -> None:
+    """Draws the static artwork of a bi-panel tent: border, fold line, and flap label."""
+    half_h = tag_height / 2.0
+
+    # Outer border
+    if draw_border:
+        pdf.setStrokeColor(colors.black)
+        pdf.setLineWidth(0.8)
+        pdf.rect(x, y, tag_width, tag_height, stroke=1, fill=0)
+
+    # Fold line (dashed)
+    pdf.setStrokeColor(colors.black)
+    pdf.setLineWidth(0.6)
+    pdf.setDash(3, 3)
+    pdf.line(x, y + half_h, x + tag_width, y + half_h)
+    pdf.setDash()
+
+    # Bottom half: flap label
     pdf.saveState()
     pdf.translate(x, y)
-    pdf.setFont("Helvetica", 9)
+    pdf.setFont("Helvetica", 10)
     pdf.setFillColor(colors.grey)
     label = "Fold/Glue Flap"
-    lw = measure_text_width(pdf, label, "Helvetica", 9)
-    pdf.drawString((tag_width - lw) / 2.0, panel_h / 2.0 - 4, label)
+    lw = measure_text_width(label, "Helvetica", 10)
+    pdf.drawString((tag_width - lw) / 2.0, half_h / 2.0 - 5, label)
     pdf.restoreState()
 
 
@@ -405,6 +704,7 @@ def draw_tent_card_bi(
     name_text: str,
     footer_text: str,
     draw_border: bool = True,
+    frame_name: Optional[str] = None,
 ) -> None:
     """Draw a two-panel tent: top half is nametag, bottom half is flap (equal height).
 
@@ -416,18 +716,11 @@ def draw_tent_card_bi(
     pad_x = 0.35 * inch
     pad_y = 0.18 * inch
 
-    # Outer border
-    if draw_border:
-        pdf.setStrokeColor(colors.black)
-        pdf.setLineWidth(0.8)
-        pdf.rect(x, y, tag_width, tag_height, stroke=1, fill=0)
-
-    # Fold line (dashed)
-    pdf.setStrokeColor(colors.black)
-    pdf.setLineWidth(0.6)
-    pdf.setDash(3, 3)
-    pdf.line(x, y + half_h, x + tag_width, y + half_h)
-    pdf.setDash()
+    # Border, fold line, and flap label
+    if frame_name:
+        _draw_frame_form(pdf, frame_name, x, y)
+    else:
+        _draw_tent_card_bi_frame(pdf, x, y, tag_width, tag_height, draw_border)
 
     # Top half: nametag
     pdf.saveState()
@@ -435,20 +728,10 @@ def draw_tent_card_bi(
     _draw_panel_content_at_origin(pdf, tag_width, half_h, name_text, footer_text, pad_x, pad_y)
     pdf.restoreState()
 
-    # Bottom half: flap label
-    pdf.saveState()
-    pdf.translate(x, y)
-    pdf.setFont("Helvetica", 10)
-    pdf.setFillColor(colors.grey)
-    label = "Fold/Glue Flap"
-    lw = measure_text_width(pdf, label, "Helvetica", 10)
-    pdf.drawString((tag_width - lw) / 2.0, half_h / 2.0 - 5, label)
-    pdf.restoreState()
-
 
 def generate_pdf(
-    names: Sequence[str],
-    output_path: str,
+    names: Iterable[str],
+    output_path: Union[str, BinaryIO],
     footer_text: str,
     page_size_name: str = "letter",
     draw_border: bool = True,
@@ -456,7 +739,14 @@ def generate_pdf(
     cols: int = 2,
     tent: bool = False,
     tent_style: str = "tri",
-) -> None:
+    compress: bool = True,
+) -> int:
+    """Draw one tag per name and return how many were drawn.
+
+    Names are consumed once, in order, so any iterable (such as the generator
+    from read_full_names_from_csv) works; pages are emitted as they fill. When
+    there are no names nothing is written.
+    """
     # Page setup
     if page_size_name.lower() == "a4":
         base_size = A4
@@ -464,7 +754,12 @@ def generate_pdf(
         base_size = letter
     page_width, page_height = landscape(base_size)
 
-    pdf = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+    # Compressed content streams are much smaller; disable to inspect raw PDF output
+    pdf = StateCachingCanvas(
+        output_path,
+        pagesize=(page_width, page_height),
+        pageCompression=1 if compress else 0,
+    )
     pdf.setTitle("Nametags")
     pdf.setAuthor("Nametag Generator")
 
@@ -475,18 +770,34 @@ def generate_pdf(
     tag_width = page_width / tags_per_row
     tag_height = page_height / tags_per_col
 
+    # Bottom-left corner of each cell, filled left to right, top row first.
+    # Rows are counted top-down, so convert to reportlab's bottom-left origin
+    # (the top row sits at page_height - tag_height).
+    cell_origins = [
+        (col_index * tag_width, page_height - (row_index_top_down + 1) * tag_height)
+        for row_index_top_down in range(tags_per_col)
+        for col_index in range(tags_per_row)
+    ]
+
+    # Tent cards repeat the same border, fold lines, and flap label on every
+    # tag, so emit them once as a form and reference it from each cell. A flat
+    # tag's border is a single rectangle, cheaper to draw than to place a form.
+    frame_name: Optional[str] = None
+    if tent:
+        draw_frame = _draw_tent_card_frame if tent_style == "tri" else _draw_tent_card_bi_frame
+        frame_name = "nametag_frame"
+        # Pad the bounding box so the border stroke is not clipped at the edges
+        pdf.beginForm(frame_name, -1, -1, tag_width + 1, tag_height + 1)
+        draw_frame(pdf, 0, 0, tag_width, tag_height, draw_border)
+        pdf.endForm()
+
+    count = 0
     for idx, name in enumerate(names):
-        if idx > 0 and idx % tags_per_page == 0:
+        count += 1
+        slot = idx % tags_per_page
+        if idx and slot == 0:
             pdf.showPage()
-
-        pos_in_page = idx % tags_per_page
-        col_index = pos_in_page % tags_per_row
-        row_index_top_down = pos_in_page // tags_per_row  # 0 for top row, 1 for bottom row
-
-        # Convert top-down row index to reportlab's bottom-left origin
-        # Top row y should be page_height - tag_height
-        x = col_index * tag_width
-        y = page_height - (row_index_top_down + 1) * tag_height
+        x, y = cell_origins[slot]
 
         if tent and tent_style == "tri":
             draw_tent_card(
@@ -498,6 +809,7 @@ def generate_pdf(
                 name_text=name,
                 footer_text=footer_text,
                 draw_border=draw_border,
+                frame_name=frame_name,
             )
         elif tent and tent_style == "bi":
             draw_tent_card_bi(
@@ -509,6 +821,7 @@ def generate_pdf(
                 name_text=name,
                 footer_text=footer_text,
                 draw_border=draw_border,
+                frame_name=frame_name,
             )
         else:
             draw_nametag(
@@ -520,9 +833,81 @@ def generate_pdf(
                 name_text=name,
                 footer_text=footer_text,
                 draw_border=draw_border,
+                frame_name=frame_name,
             )
 
-    pdf.save()
+    if count:
+        pdf.save()
+    return count
+
+
+def _render_chunk(names: Sequence[str], options: Dict[str, object]) -> bytes:
+    """Render one chunk of nametags to an in-memory PDF (runs in a worker process)."""
+    buffer = io.BytesIO()
+    generate_pdf(names, buffer, **options)
+    return buffer.getvalue()
+
+
+def generate_pdf_parallel(
+    names: Iterable[str],
+    output_path: str,
+    footer_text: str,
+    page_size_name: str = "letter",
+    draw_border: bool = True,
+    rows: int = 2,
+    cols: int = 2,
+    tent: bool = False,
+    tent_style: str = "tri",
+    compress: bool = True,
+    jobs: int = 1,
+) -> int:
+    """Render nametags across worker processes and merge the pages into one PDF.
+
+    Names are split into page-aligned chunks so every page is drawn by exactly
+    one worker and the merged document matches a single-process render. With
+    one job this is just generate_pdf and names are streamed; otherwise they are
+    read up front to size the chunks. Returns the number of tags drawn.
+    """
+    options: Dict[str, object] = dict(
+        footer_text=footer_text,
+        page_size_name=page_size_name,
+        draw_border=draw_border,
+        rows=rows,
+        cols=cols,
+        tent=tent,
+        tent_style=tent_style,
+        compress=compress,
+    )
+    if jobs <= 1:
+        return generate_pdf(names, output_path, **options)
+
+    names = list(names)
+    tags_per_page = max(1, int(rows)) * max(1, int(cols))
+    total_pages = math.ceil(len(names) / tags_per_page)
+    jobs = min(jobs, total_pages)
+    if jobs <= 1:
+        return generate_pdf(names, output_path, **options)
+
+    try:
+        from pypdf import PdfWriter
+    except ImportError as exc:
+        raise RuntimeError(
+            "Rendering with more than one job requires pypdf. "
+            "Install it with 'python -m pip install pypdf'."
+        ) from exc
+
+    chunk_size = math.ceil(total_pages / jobs) * tags_per_page
+    chunks = [names[start:start + chunk_size] for start in range(0, len(names), chunk_size)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        rendered = list(executor.map(_render_chunk, chunks, repeat(options)))
+
+    writer = PdfWriter()
+    for chunk_pdf in rendered:
+        writer.append(io.BytesIO(chunk_pdf))
+    writer.add_metadata({"/Title": "Nametags", "/Author": "Nametag Generator"})
+    with open(output_path, "wb") as f:
+        writer.write(f)
+    return len(names)
 
 
 def parse_args() -> argparse.Namespace:
@@ -579,20 +964,41 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Path to a CSV with columns 'netid,preferred_name' to override names",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Write uncompressed page content streams (for debugging raw PDF output)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering large rosters; 0 uses all CPU cores (default: 1)",
+    )
+    args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (all CPU cores) or a positive number of processes")
+    return args
 
 
 def main() -> None:
     args = parse_args()
     preferred_map: Optional[Dict[str, str]] = None
-    if args.preferred_names_csv:
-        if not os.path.exists(args.preferred_names_csv):
-            raise SystemExit(f"Preferred names CSV not found: {args.preferred_names_csv}")
-        preferred_map = load_preferred_names_csv(args.preferred_names_csv)
-
-    names = read_full_names_from_csv(args.input_csv, preferred_by_netid=preferred_map)
-    if not names:
-        raise SystemExit("No names found in CSV.")
+    # Preferred names kept in the students CSV itself are applied in the main pass
+    inline_preferred = bool(args.preferred_names_csv) and (
+        os.path.realpath(args.preferred_names_csv) == os.path.realpath(args.input_csv)
+    )
+    if args.preferred_names_csv and not inline_preferred:
+        try:
+            preferred_map = load_preferred_names_csv(args.preferred_names_csv)
+        except FileNotFoundError:
+            raise SystemExit(f"Preferred names CSV not found: {args.preferred_names_csv}") from None
+
+    names = read_full_names_from_csv(
+        args.input_csv,
+        preferred_by_netid=preferred_map,
+        inline_preferred=inline_preferred,
+    )
 
     output_path = args.output
     # Ensure output directory exists
@@ -609,7 +1015,9 @@ def main() -> None:
         else:
             rows, cols = 2, 1
 
-    generate_pdf(
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    count = generate_pdf_parallel(
         names=names,
         output_path=output_path,
         footer_text=args.footer,
@@ -619,8 +1027,12 @@ def main() -> None:
         cols=cols,
         tent=args.tent,
         tent_style=args.tent_style,
+        compress=(not args.no_compress),
+        jobs=jobs,
     )
-    print(f"Wrote {len(names)} nametags to {output_path}")
+    if not count:
+        raise SystemExit("No names found in CSV.")
+    print(f"Wrote {count} nametags to {output_path}")
 
 
 if __name__ == "__main__":